@@ -19,14 +19,15 @@
 """
 A single-class module, providing the BasicAssetLibraryInterface class.
 """
+
 import json
 import os
 import re
 import time
+import types
 
 from functools import wraps
-from typing import Iterable, List, Any
-from urllib.parse import urlparse, parse_qs
+from typing import Iterable, List, Any, Optional, Tuple
 
 from openassetio import constants, EntityReference
 from openassetio.access import (
@@ -37,7 +38,7 @@ from openassetio.access import (
     kAccessNames,
 )
 from openassetio.errors import BatchElementError, ConfigurationException
-from openassetio.managerApi import ManagerInterface, EntityReferencePagerInterface
+from openassetio.managerApi import ManagerInterface
 from openassetio.trait import TraitsData
 
 from openassetio_mediacreation.traits.lifecycle import VersionTrait, StableTrait
@@ -48,7 +49,12 @@ from openassetio_mediacreation.specifications.lifecycle import (
 )
 
 from . import bal
-
+from .entity_references import (
+    VERSION_TAG_LATEST,
+    BALEntityReferencePagerInterface,
+    make_entity_ref_factory,
+    parse_entity_ref,
+)
 
 __all__ = [
     "BasicAssetLibraryInterface",
@@ -62,7 +68,42 @@ SETTINGS_KEY_LIBRARY_JSON = "library_json"
 SETTINGS_KEY_SIMULATED_QUERY_LATENCY = "simulated_query_latency_ms"
 SETTINGS_KEY_ENTITY_REFERENCE_URL_SCHEME = "entity_reference_url_scheme"
 
-VERSION_TAG_LATEST = "latest"
+# Note: as a library is required, the default settings are not enough
+# to initialize the manager.
+_DEFAULT_SETTINGS = types.MappingProxyType(
+    {
+        SETTINGS_KEY_LIBRARY_PATH: "",
+        SETTINGS_KEY_SIMULATED_QUERY_LATENCY: 10,
+        SETTINGS_KEY_ENTITY_REFERENCE_URL_SCHEME: "bal",
+    }
+)
+
+# Legal URL scheme characters. Note `\Z` rather than `$`, which would
+# also accept a trailing newline.
+_URL_SCHEME_PATTERN = re.compile(r"^[a-zA-Z0-9-]+\Z")
+
+# Relationship trait sets that are handled implicitly rather than via
+# the library, frozen so that they can be matched by hash.
+_ENTITY_VERSIONS_RELATIONSHIP_TRAIT_SETS = frozenset(
+    (
+        frozenset(EntityVersionsRelationshipSpecification.kTraitSet),
+        frozenset(StableEntityVersionsRelationshipSpecification.kTraitSet),
+    )
+)
+_STABLE_REFERENCE_RELATIONSHIP_TRAIT_SET = frozenset(
+    StableReferenceRelationshipSpecification.kTraitSet
+)
+
+# BatchElementErrors are immutable, so errors with a fixed message can
+# be shared rather than constructed per failed element.
+_ERROR_PUBLISH_MISSING_TRAITS = BatchElementError(
+    BatchElementError.ErrorCode.kInvalidTraitSet,
+    "Publishing to this entity requires traits that are missing from the input",
+)
+_ERROR_PUBLISH_UNSUPPORTED_TRAIT_SET = BatchElementError(
+    BatchElementError.ErrorCode.kInvalidTraitSet,
+    "Publishing is not supported for the given trait set",
+)
 
 
 # TODO(TC): @pylint-disable
@@ -78,22 +119,44 @@ def simulated_delay(func):
     @wraps(func)
     def wrapper_simulated_delay(self, *args, **kwargs):
         # pylint: disable=protected-access
-        delay_ms = self.simulated_latency
-        if delay_ms > 0:
-            time.sleep(delay_ms / 1000.0)  # sleep takes seconds
+        delay_s = self._simulated_delay_s
+        # An empty batch would involve no queries, so has no latency to
+        # simulate.
+        if delay_s and not _is_empty_batch(args):
+            time.sleep(delay_s)
         return func(self, *args, **kwargs)
 
     return wrapper_simulated_delay
 
 
-class MalformedEntityReference(RuntimeError):
+def _is_empty_batch(args) -> bool:
     """
-    An exception raised for a reference to an entity reference that is
-    formatted incorrectly or otherwise malformed.
+    Determines if the batch passed to an API method is empty. The batch
+    is the first list argument, which is usually the first argument,
+    but getWithRelationships takes a single entity reference, then its
+    batch of relationships.
+
+    This only covers calls via the OpenAssetIO bindings, which always
+    pass batches positionally, as lists. A batch passed any other way
+    is conservatively treated as non-empty, and so still delayed.
     """
+    for arg in args[:2]:
+        if isinstance(arg, list):
+            return not arg
+    return False
+
+
+# Malformed references are reported per element as they are parsed,
+# rather than raised, so aren't in the exception table below.
+_MALFORMED_ENTITY_REFERENCE_CODE = BatchElementError.ErrorCode.kMalformedEntityReference
 
-    def __init__(self, malformed_reason: str, entity_ref: str):
-        super().__init__(f"{malformed_reason} ({entity_ref})")
+# The BatchElementError code to report for each expected exception.
+_EXCEPTION_ERROR_CODES = {
+    bal.UnknownBALEntity: BatchElementError.ErrorCode.kEntityResolutionError,
+    bal.InvalidEntityVersion: BatchElementError.ErrorCode.kEntityResolutionError,
+    bal.InaccessibleEntity: BatchElementError.ErrorCode.kEntityAccessError,
+    bal.UnknownTraitSet: BatchElementError.ErrorCode.kInvalidTraitSet,
+}
 
 
 class BasicAssetLibraryInterface(ManagerInterface):
@@ -106,8 +169,10 @@ class BasicAssetLibraryInterface(ManagerInterface):
 
     def __init__(self):
         super().__init__()
-        self.__settings = self.__make_default_settings()
+        self.__settings = dict(_DEFAULT_SETTINGS)
         self.__library = {}
+        self.__management_policies = {}
+        self.__update_settings_derived_state()
 
     def identifier(self):
         return os.environ.get(ENV_VAR_IDENTIFIER_OVERRIDE, DEFAULT_IDENTIFIER)
@@ -117,7 +182,7 @@ class BasicAssetLibraryInterface(ManagerInterface):
         return "Basic Asset Library 📖"
 
     def info(self):
-        return {constants.kInfoKey_EntityReferencesMatchPrefix: self.__entity_refrence_prefix()}
+        return {constants.kInfoKey_EntityReferencesMatchPrefix: self.__entity_reference_prefix}
 
     def settings(self, hostSession):
         augmented_settings = self.__settings.copy()
@@ -173,14 +238,15 @@ class BasicAssetLibraryInterface(ManagerInterface):
     def initialize(self, managerSettings, hostSession):
         self.__validate_settings(managerSettings)
         logger = hostSession.logger()
+        debug = logger.Severity.kDebug
         # Settings updates can be partial, so make sure we keep any
         # existing path.
-        existing_library_path = self.__settings.get("library_path")
-        library_path = managerSettings.get("library_path", existing_library_path)
+        existing_library_path = self.__settings.get(SETTINGS_KEY_LIBRARY_PATH)
+        library_path = managerSettings.get(SETTINGS_KEY_LIBRARY_PATH, existing_library_path)
 
         if not library_path:
             logger.log(
-                logger.Severity.kDebug,
+                debug,
                 "'library_path' not in settings or is empty, checking "
                 f"{self.__lib_path_envvar_name}",
             )
@@ -189,7 +255,7 @@ class BasicAssetLibraryInterface(ManagerInterface):
         # Pop from dictionary so it doesn't get merged into persistent
         # settings, since the library will be serialised on-demand in
         # `settings()`.
-        library_json = managerSettings.pop("library_json", None)
+        library_json = managerSettings.pop(SETTINGS_KEY_LIBRARY_JSON, None)
 
         if not library_path and not library_json:
             raise ConfigurationException(
@@ -197,23 +263,41 @@ class BasicAssetLibraryInterface(ManagerInterface):
             )
 
         self.__settings.update(managerSettings)
-        self.__settings["library_path"] = library_path
+        # The resolved path may have come from the existing settings or
+        # the environment, rather than managerSettings.
+        self.__settings[SETTINGS_KEY_LIBRARY_PATH] = library_path
+        self.__update_settings_derived_state()
 
         if library_json is not None:
-            if logger.isSeverityLogged(logger.Severity.kDebug):
-                logger.log(logger.Severity.kDebug, f"Parsing library from '{library_json}'")
+            if logger.isSeverityLogged(debug):
+                logger.log(debug, f"Parsing library from '{library_json}'")
             self.__library = bal.parse_library(library_json)
 
         else:
-            logger.log(logger.Severity.kDebug, f"Loading library from '{library_path}'")
+            logger.log(debug, f"Loading library from '{library_path}'")
             self.__library = bal.load_library(library_path)
 
+        self.__management_policies = {}
+
         logger.log(
-            logger.Severity.kDebug,
+            debug,
             f"Running with simulated query latency of "
             f"{self.__settings[SETTINGS_KEY_SIMULATED_QUERY_LATENCY]}ms",
         )
 
+    def __update_settings_derived_state(self):
+        """
+        Caches values derived from the settings, which are otherwise
+        costly to recompute on every API call.
+        """
+        self.__entity_reference_prefix = (
+            f"{self.__settings[SETTINGS_KEY_ENTITY_REFERENCE_URL_SCHEME]}:///"
+        )
+        # Entity references embed the prefix, so can't outlive it.
+        self.__create_entity_ref = make_entity_ref_factory(self.__entity_reference_prefix)
+        # Used by simulated_delay, sleep takes seconds.
+        self._simulated_delay_s = self.simulated_latency / 1000.0
+
     def managementPolicy(self, traitSets, access, context, hostSession):
         ## NOTE:
         #
@@ -235,15 +319,16 @@ class BasicAssetLibraryInterface(ManagerInterface):
         #  - Imbue the VersionTrait if requested in an entity trait
         #    set to indicate it can be resolved.
 
+        access_name = kAccessNames[int(access)]
+        # A new TraitsData is created for each element, as the host may
+        # mutate them.
         return [
-            self.__dict_to_traits_data(
-                bal.management_policy(trait_set, kAccessNames[int(access)], self.__library)
-            )
+            self.__dict_to_traits_data(self.__management_policy(trait_set, access_name))
             for trait_set in traitSets
         ]
 
     def isEntityReferenceString(self, someString, hostSession):
-        return someString.startswith(self.__entity_refrence_prefix())
+        return someString.startswith(self.__entity_reference_prefix)
 
     @simulated_delay
     def defaultEntityReference(
@@ -286,40 +371,47 @@ class BasicAssetLibraryInterface(ManagerInterface):
             super().entityExists(entityRefs, context, _hostSession, successCallback, errorCallback)
             return
 
-        for idx, ref in enumerate(entityRefs):
-            try:
-                # Use resolve-for-read access mode as closest analog.
-                entity_info = self.__parse_entity_ref(ref.toString(), ResolveAccess.kRead)
-                result = bal.exists(entity_info, self.__library)
-                successCallback(idx, result)
-            except Exception as exc:  # pylint: disable=broad-except
-                self.__handle_exception(exc, idx, errorCallback)
+        # Use resolve-for-read access mode as closest analog.
+        parsed_refs = self.__parse_entity_refs(entityRefs, ResolveAccess.kRead)
+        existences = iter(bal.entities_exist(self.__entity_infos(parsed_refs), self.__library))
+        for idx, (ref_str, _, malformed_reason) in enumerate(parsed_refs):
+            if malformed_reason is not None:
+                self.__report_malformed_entity_ref(malformed_reason, ref_str, idx, errorCallback)
+                continue
+            successCallback(idx, next(existences))
 
     @simulated_delay
     def entityTraits(
         self, entityRefs, entityTraitsAccess, context, _hostSession, successCallback, errorCallback
     ):
-        for idx, ref in enumerate(entityRefs):
-            try:
-                entity_info = self.__parse_entity_ref(ref.toString(), entityTraitsAccess)
-
-                if entityTraitsAccess == EntityTraitsAccess.kRead:
-                    entity = bal.entity(entity_info, self.__library)
-                    result = set(entity.traits.keys())
-                    # VersionTrait for read, but not for write.
-                    result |= {VersionTrait.kId}
-                else:  # entityTraitsAccess == EntityTraitsAccess.kWrite
-                    if bal.exists(entity_info, self.__library):
-                        entity = bal.entity(entity_info, self.__library)
-                        result = set(entity.traits.keys())
-                    else:
-                        # Non-existent entities are writable with no
-                        # trait restrictions.
-                        result = set()
-
-                successCallback(idx, result)
-            except Exception as exc:  # pylint: disable=broad-except
-                self.__handle_exception(exc, idx, errorCallback)
+        is_read = entityTraitsAccess == EntityTraitsAccess.kRead
+        parsed_refs = self.__parse_entity_refs(entityRefs, entityTraitsAccess)
+        entities = iter(
+            bal.entities(self.__entity_infos(parsed_refs), self.__library, with_relations=False)
+        )
+        for idx, (ref_str, _, malformed_reason) in enumerate(parsed_refs):
+            if malformed_reason is not None:
+                self.__report_malformed_entity_ref(malformed_reason, ref_str, idx, errorCallback)
+                continue
+            entity = next(entities)
+            if isinstance(entity, Exception):
+                # These are the cases where bal.exists is False, and
+                # non-existent entities are writable with no trait
+                # restrictions.
+                if not is_read and isinstance(
+                    entity, (bal.UnknownBALEntity, bal.InvalidEntityVersion)
+                ):
+                    successCallback(idx, set())
+                else:
+                    self.__handle_exception(entity, idx, errorCallback)
+                continue
+
+            result = set(entity.traits)
+            if is_read:
+                # VersionTrait for read, but not for write.
+                result.add(VersionTrait.kId)
+
+            successCallback(idx, result)
 
     @simulated_delay
     def resolve(
@@ -345,27 +437,35 @@ class BasicAssetLibraryInterface(ManagerInterface):
             )
             return
 
-        for idx, ref in enumerate(entityReferences):
-            try:
-                entity_info = self.__parse_entity_ref(ref.toString(), access)
-                entity = bal.entity(entity_info, self.__library)
-
-                # Ensure this entity supports the type of access
-                # requested.
-                result = TraitsData()
-                for trait in traitSet:
-                    trait_data = entity.traits.get(trait)
-                    if trait_data:
-                        self.__add_trait_to_traits_data(trait, trait_data, result)
-
-                if VersionTrait.kId in traitSet:
-                    version_trait = VersionTrait(result)
-                    version_trait.setStableTag(str(entity.version))
-                    version_trait.setSpecifiedTag(str(entity_info.version or VERSION_TAG_LATEST))
-
-                successCallback(idx, result)
-            except Exception as exc:  # pylint: disable=broad-except
-                self.__handle_exception(exc, idx, errorCallback)
+        # Loop invariants, hoisted for large batches.
+        trait_ids = frozenset(traitSet)
+        is_version_requested = VersionTrait.kId in traitSet
+
+        parsed_refs = self.__parse_entity_refs(entityReferences, access)
+        # Look up all well-formed references in one bal call.
+        entities = iter(
+            bal.entities(self.__entity_infos(parsed_refs), self.__library, with_relations=False)
+        )
+
+        for idx, (ref_str, entity_info, malformed_reason) in enumerate(parsed_refs):
+            if malformed_reason is not None:
+                self.__report_malformed_entity_ref(malformed_reason, ref_str, idx, errorCallback)
+                continue
+            entity = next(entities)
+            if isinstance(entity, Exception):
+                self.__handle_exception(entity, idx, errorCallback)
+                continue
+
+            # Ensure this entity supports the type of access
+            # requested.
+            result = self.__entity_traits_to_traits_data(entity, trait_ids)
+
+            if is_version_requested:
+                version_trait = VersionTrait(result)
+                version_trait.setStableTag(str(entity.version))
+                version_trait.setSpecifiedTag(str(entity_info.version or VERSION_TAG_LATEST))
+
+            successCallback(idx, result)
 
     @simulated_delay
     def preflight(
@@ -399,12 +499,17 @@ class BasicAssetLibraryInterface(ManagerInterface):
         ):
             return
 
-        for idx, ref in enumerate(targetEntityRefs):
-            if not self.__validate_publish_policy(traitsDatas[idx], access, idx, errorCallback):
+        access_name = kAccessNames[access]
+        parsed_refs = self.__parse_entity_refs(targetEntityRefs, access)
+        for idx, (ref_str, entity_info, malformed_reason) in enumerate(parsed_refs):
+            if not self.__validate_publish_policy(
+                traitsDatas[idx], access_name, idx, errorCallback
+            ):
+                continue
+            if malformed_reason is not None:
+                self.__report_malformed_entity_ref(malformed_reason, ref_str, idx, errorCallback)
                 continue
             try:
-                entity_info = self.__parse_entity_ref(ref.toString(), access)
-
                 if not self.__validate_publish_entity_traits(
                     entity_info, traitsDatas[idx].traitSet(), idx, errorCallback
                 ):
@@ -428,6 +533,7 @@ class BasicAssetLibraryInterface(ManagerInterface):
         successCallback,
         errorCallback,
     ):
+        # pylint: disable=too-many-locals
         if not self.hasCapability(self.Capability.kPublishing):
             super().register(
                 targetEntityRefs,
@@ -449,15 +555,17 @@ class BasicAssetLibraryInterface(ManagerInterface):
         ):
             return
 
-        for idx, ref in enumerate(targetEntityRefs):
+        access_name = kAccessNames[access]
+        parsed_refs = self.__parse_entity_refs(targetEntityRefs, access)
+        for idx, (ref_str, entity_info, malformed_reason) in enumerate(parsed_refs):
             if not self.__validate_publish_policy(
-                entityTraitsDatas[idx], access, idx, errorCallback
+                entityTraitsDatas[idx], access_name, idx, errorCallback
             ):
                 continue
-
+            if malformed_reason is not None:
+                self.__report_malformed_entity_ref(malformed_reason, ref_str, idx, errorCallback)
+                continue
             try:
-                entity_info = self.__parse_entity_ref(ref.toString(), access)
-
                 if not self.__validate_publish_entity_traits(
                     entity_info, entityTraitsDatas[idx].traitSet(), idx, errorCallback
                 ):
@@ -472,36 +580,23 @@ class BasicAssetLibraryInterface(ManagerInterface):
                 self.__handle_exception(exc, idx, errorCallback)
 
     def __validate_publish_entity_traits(self, entity_info, trait_ids, idx, error_callback):
-        if not bal.exists(entity_info, self.__library):
+        try:
+            entity = bal.entity(entity_info, self.__library, with_relations=False)
+        except (bal.UnknownBALEntity, bal.InvalidEntityVersion):
             # Can publish with any traits if the entity doesn't exist.
             return True
 
-        entity = bal.entity(entity_info, self.__library)
         # Entities must be published with the same trait set as they
         # currently have (can be overridden per access mode).
-        if not set(entity.traits.keys()).issubset(trait_ids):
-            error_callback(
-                idx,
-                BatchElementError(
-                    BatchElementError.ErrorCode.kInvalidTraitSet,
-                    "Publishing to this entity requires traits that are missing from the input",
-                ),
-            )
+        if not entity.traits.keys() <= trait_ids:
+            error_callback(idx, _ERROR_PUBLISH_MISSING_TRAITS)
             return False
         return True
 
-    def __validate_publish_policy(self, traits_data, access, idx, error_callback):
-        policy = bal.management_policy(
-            traits_data.traitSet(), kAccessNames[access], self.__library
-        )
+    def __validate_publish_policy(self, traits_data, access_name, idx, error_callback):
+        policy = self.__management_policy(traits_data.traitSet(), access_name)
         if not policy:
-            error_callback(
-                idx,
-                BatchElementError(
-                    BatchElementError.ErrorCode.kInvalidTraitSet,
-                    "Publishing is not supported for the given trait set",
-                ),
-            )
+            error_callback(idx, _ERROR_PUBLISH_UNSUPPORTED_TRAIT_SET)
             return False
         return True
 
@@ -518,6 +613,7 @@ class BasicAssetLibraryInterface(ManagerInterface):
         successCallback,
         errorCallback,
     ):
+        # pylint: disable=too-many-locals
         if not self.hasCapability(self.Capability.kRelationshipQueries):
             super().getWithRelationship(
                 entityReferences,
@@ -540,18 +636,25 @@ class BasicAssetLibraryInterface(ManagerInterface):
             errorCallback,
         ):
             return
-        for idx, entity_ref in enumerate(entityReferences):
+        # Captured now, so that the pagers' references use the settings
+        # in effect at query time, even if the manager is reinitialized.
+        create_entity_ref = self.__create_entity_ref
+        # The relationship is shared by all elements, so only copy its
+        # traits out of the TraitsData once.
+        relationship_traits_dict = self.__traits_data_to_dict(relationshipTraitsData)
+        parsed_refs = self.__parse_entity_refs(entityReferences, access)
+        for idx, (ref_str, entity_info, malformed_reason) in enumerate(parsed_refs):
+            if malformed_reason is not None:
+                self.__report_malformed_entity_ref(malformed_reason, ref_str, idx, errorCallback)
+                continue
             try:
-                entity_info = self.__parse_entity_ref(entity_ref.toString(), access)
                 relations = self.__get_relations(
-                    entity_info, relationshipTraitsData, resultTraitSet
+                    entity_info, relationshipTraitsData, relationship_traits_dict, resultTraitSet
                 )
                 successCallback(
                     idx,
                     BALEntityReferencePagerInterface(
-                        self.simulated_latency,
-                        pageSize,
-                        [self.__build_entity_ref(info) for info in relations],
+                        self._simulated_delay_s, pageSize, relations, create_entity_ref
                     ),
                 )
             except Exception as exc:  # pylint: disable=broad-except
@@ -570,6 +673,7 @@ class BasicAssetLibraryInterface(ManagerInterface):
         successCallback,
         errorCallback,
     ):
+        # pylint: disable=too-many-locals
         if not self.hasCapability(self.Capability.kRelationshipQueries):
             super().getWithRelationships(
                 entityReference,
@@ -592,64 +696,92 @@ class BasicAssetLibraryInterface(ManagerInterface):
             errorCallback,
         ):
             return
+        # The same entity is queried for each relationship, so only
+        # parse its reference once.
+        ref_str, entity_info, malformed_reason = self.__parse_entity_refs(
+            [entityReference], access
+        )[0]
+        # Captured now, as in getWithRelationship.
+        create_entity_ref = self.__create_entity_ref
         for idx, relationship in enumerate(relationshipTraitsDatas):
+            if malformed_reason is not None:
+                self.__report_malformed_entity_ref(malformed_reason, ref_str, idx, errorCallback)
+                continue
             try:
-                entity_info = self.__parse_entity_ref(entityReference.toString(), access)
-                relations = self.__get_relations(entity_info, relationship, resultTraitSet)
+                relations = self.__get_relations(
+                    entity_info,
+                    relationship,
+                    self.__traits_data_to_dict(relationship),
+                    resultTraitSet,
+                )
                 successCallback(
                     idx,
                     BALEntityReferencePagerInterface(
-                        self.simulated_latency,
-                        pageSize,
-                        [self.__build_entity_ref(info) for info in relations],
+                        self._simulated_delay_s, pageSize, relations, create_entity_ref
                     ),
                 )
             except Exception as exc:  # pylint: disable=broad-except
                 self.__handle_exception(exc, idx, errorCallback)
 
-    def __get_relations(self, entity_info, relationship_traits_data, result_trait_set):
+    def __management_policy(self, trait_set, access_name: str) -> dict:
+        """
+        Retrieves the library's management policy for the supplied
+        trait set and access mode. Hosts query the same few trait sets
+        over and over, and publishing checks the policy per element, so
+        these are memoised until the library is next loaded.
+        """
+        key = (frozenset(trait_set), access_name)
+        policy = self.__management_policies.get(key)
+        if policy is None:
+            policy = bal.management_policy(trait_set, access_name, self.__library)
+            self.__management_policies[key] = policy
+        return policy
+
+    def __get_relations(
+        self, entity_info, relationship_traits_data, relationship_traits_dict, result_trait_set
+    ):
         """
         Retrieves relations based on the supplied traits data, by
         dispatching to individual handlers for any implicit relationship
         specifications. Falling back on library defined relations in all
         other cases.
+
+        relationship_traits_dict is expected to be the result of
+        __traits_data_to_dict for relationship_traits_data, so that
+        callers can reuse it across elements.
         """
-        relationship_trait_set = relationship_traits_data.traitSet()
+        relationship_trait_set = frozenset(relationship_traits_dict)
 
         # We don't use issuperset as otherwise we'd end up responding to
         # any more specialized relationship definitions that may be
         # added in the future, with incorrect results.
 
-        if relationship_trait_set in (
-            EntityVersionsRelationshipSpecification.kTraitSet,
-            StableEntityVersionsRelationshipSpecification.kTraitSet,
-        ):
+        if relationship_trait_set in _ENTITY_VERSIONS_RELATIONSHIP_TRAIT_SETS:
             # Fetch other versions of the same entity
             return self.__get_relations_entity_versions(entity_info, relationship_traits_data)
 
-        if relationship_trait_set == StableReferenceRelationshipSpecification.kTraitSet:
+        if relationship_trait_set == _STABLE_REFERENCE_RELATIONSHIP_TRAIT_SET:
             # Remove dynamic behaviour from the reference
             return self.__get_relation_stable(entity_info)
 
         return self.__get_relations_from_library(
-            entity_info, relationship_traits_data, result_trait_set
+            entity_info, relationship_traits_dict, result_trait_set
         )
 
     def __get_relations_entity_versions(self, entity_info, relationship_traits_data):
         """
         Retrieves entity infos for versions of the specified entity.
         """
-        include_latest = StableTrait.kId not in relationship_traits_data.traitSet()
+        include_latest = not relationship_traits_data.hasTrait(StableTrait.kId)
         versions = bal.versions(entity_info, include_latest, self.__library)
         # Filter to a specific version if requested
         specified_version = VersionTrait(relationship_traits_data).getSpecifiedTag()
-        if specified_version:
-            if specified_version == VERSION_TAG_LATEST:
-                versions = [versions[0]]
-            else:
-                versions = [i for i in versions if i.version == int(specified_version)]
-
-        return versions
+        if not specified_version:
+            return versions
+        if specified_version == VERSION_TAG_LATEST:
+            return [versions[0]]
+        version_info = bal.entity_version(entity_info, int(specified_version), self.__library)
+        return [version_info] if version_info is not None else []
 
     def __get_relation_stable(self, entity_info):
         """
@@ -667,76 +799,55 @@ class BasicAssetLibraryInterface(ManagerInterface):
         ]
 
     def __get_relations_from_library(
-        self, entity_info, relationship_traits_data, result_trait_set
+        self, entity_info, relationship_traits_dict, result_trait_set
     ):
         """
         Retrieves arbitrary relations as defined in the BAL library.
         """
         return bal.related_references(
             entity_info,
-            self.__traits_data_to_dict(relationship_traits_data),
+            relationship_traits_dict,
             result_trait_set,
             self.__library,
         )
 
-    @classmethod
-    def __parse_entity_ref(cls, entity_ref: str, access) -> bal.EntityInfo:
+    def __parse_entity_refs(
+        self, entity_refs, access
+    ) -> List[Tuple[str, Optional[bal.EntityInfo], Optional[str]]]:
         """
-        Decomposes an entity reference into bal fields.
+        Decomposes a batch of entity references into bal fields,
+        returning a `(ref_str, entity_info, malformed_reason)` tuple for
+        each rather than raising. entity_info is None if malformed.
         """
-        uri_parts = urlparse(entity_ref)
-
-        if len(uri_parts.path) <= 1:
-            raise MalformedEntityReference("Missing entity name in path component", entity_ref)
-
-        # path will start with a /
-        name = uri_parts.path[1:]
-
-        version = None
-
-        if uri_parts.query:
-            params = parse_qs(uri_parts.query)
-            version = cls.__version_from_query_params(params, entity_ref)
-
-        return bal.EntityInfo(name=name, version=version, access=kAccessNames[access])
+        prefix = self.__entity_reference_prefix
+        access_name = kAccessNames[access]
+        make_entity_info = bal.EntityInfo
+        parsed_refs = []
+        for ref in entity_refs:
+            ref_str = ref.toString()
+            name, version, malformed_reason = parse_entity_ref(ref_str, prefix)
+            if malformed_reason is not None:
+                parsed_refs.append((ref_str, None, malformed_reason))
+            else:
+                # Parsing is cached, but callers may mutate the
+                # EntityInfo, so a new one is created each time.
+                entity_info = make_entity_info(name=name, version=version, access=access_name)
+                parsed_refs.append((ref_str, entity_info, None))
+        return parsed_refs
 
     @staticmethod
-    def __version_from_query_params(query_params, entity_ref) -> int:
+    def __entity_infos(parsed_refs):
         """
-        Determine the version based on the presence of 'v' in the
-        supplied query params.
+        Extracts the EntityInfos of the well-formed references from the
+        result of `__parse_entity_refs`.
         """
-        if "v" not in query_params:
-            return None
-
-        v_str = query_params["v"][-1]
-        if v_str == VERSION_TAG_LATEST:
-            return None
-
-        try:
-            v = int(v_str)
-        except ValueError as exc:
-            raise MalformedEntityReference(
-                f"Version query parameter 'v' must be an int or '{VERSION_TAG_LATEST}'", entity_ref
-            ) from exc
-        if v < 1:
-            raise MalformedEntityReference(
-                "Version query parameter 'v' must be greater than 1", entity_ref
-            )
-
-        return v
+        return [entity_info for _, entity_info, _ in parsed_refs if entity_info is not None]
 
     def __build_entity_ref(self, entity_info: bal.EntityInfo) -> EntityReference:
         """
         Builds an openassetio EntityReference from a BAL EntityInfo
         """
-        ref_string = f"{self.__entity_refrence_prefix()}{entity_info.name}"
-        if entity_info.version:
-            ref_string += f"?v={entity_info.version}"
-        return self._createEntityReference(ref_string)
-
-    def __entity_refrence_prefix(self):
-        return f"{self.__settings[SETTINGS_KEY_ENTITY_REFERENCE_URL_SCHEME]}:///"
+        return self.__create_entity_ref(entity_info.name, entity_info.version)
 
     @classmethod
     def __dict_to_traits_data(cls, traits_dict: dict):
@@ -745,12 +856,37 @@ class BasicAssetLibraryInterface(ManagerInterface):
             cls.__add_trait_to_traits_data(trait_id, trait_properties, traits_data)
         return traits_data
 
+    @classmethod
+    def __entity_traits_to_traits_data(cls, entity: bal.Entity, trait_ids: frozenset):
+        """
+        Builds a TraitsData holding the subset of the entity's traits
+        named in trait_ids, skipping any the entity doesn't have.
+        """
+        traits_data = TraitsData()
+        entity_traits = entity.traits
+        # Only look up from the smaller side of the intersection.
+        if len(entity_traits) < len(trait_ids):
+            matches = (
+                (trait_id, trait_properties)
+                for trait_id, trait_properties in entity_traits.items()
+                if trait_id in trait_ids
+            )
+        else:
+            matches = ((trait_id, entity_traits.get(trait_id)) for trait_id in trait_ids)
+        for trait_id, trait_properties in matches:
+            if trait_properties:
+                cls.__add_trait_to_traits_data(trait_id, trait_properties, traits_data)
+        return traits_data
+
     @classmethod
     def __traits_data_to_dict(cls, traits_data: TraitsData):
+        # Bind the accessors up front, as this is called per element
+        # when publishing, and each lookup crosses into C++.
+        get_property = traits_data.getTraitProperty
+        property_keys = traits_data.traitPropertyKeys
         return {
             trait_id: {
-                prop_key: traits_data.getTraitProperty(trait_id, prop_key)
-                for prop_key in traits_data.traitPropertyKeys(trait_id)
+                prop_key: get_property(trait_id, prop_key) for prop_key in property_keys(trait_id)
             }
             for trait_id in traits_data.traitSet()
         }
@@ -758,8 +894,9 @@ class BasicAssetLibraryInterface(ManagerInterface):
     @staticmethod
     def __add_trait_to_traits_data(trait_id: str, trait_properties: dict, traits_data: TraitsData):
         traits_data.addTrait(trait_id)
+        set_property = traits_data.setTraitProperty
         for name, value in trait_properties.items():
-            traits_data.setTraitProperty(trait_id, name, value)
+            set_property(trait_id, name, value)
 
     def __validate_access(
         self,
@@ -771,16 +908,28 @@ class BasicAssetLibraryInterface(ManagerInterface):
     ):
         if access in allowed_access:
             return True
-        for idx, _ in enumerate(batch_elems):
-            error_callback(
-                idx,
-                BatchElementError(
-                    BatchElementError.ErrorCode.kEntityAccessError,
-                    f"Unsupported access mode for {function_name}",
-                ),
-            )
+        error = BatchElementError(
+            BatchElementError.ErrorCode.kEntityAccessError,
+            f"Unsupported access mode for {function_name}",
+        )
+        for idx in range(len(batch_elems)):
+            error_callback(idx, error)
         return False
 
+    @staticmethod
+    def __report_malformed_entity_ref(malformed_reason, entity_ref, idx, error_callback):
+        """
+        Calls the error_callback with a kMalformedEntityReference
+        BatchElementError, without the cost of creating, raising and
+        handling an exception.
+        """
+        error_callback(
+            idx,
+            BatchElementError(
+                _MALFORMED_ENTITY_REFERENCE_CODE, f"{malformed_reason} ({entity_ref})"
+            ),
+        )
+
     @staticmethod
     def __handle_exception(exc, idx, error_callback):
         """
@@ -789,36 +938,23 @@ class BasicAssetLibraryInterface(ManagerInterface):
 
         Other, exceptional exceptions are re-thrown.
         """
-        msg = str(exc)
-
-        if isinstance(exc, MalformedEntityReference):
-            code = BatchElementError.ErrorCode.kMalformedEntityReference
-        elif isinstance(exc, bal.UnknownBALEntity):
-            code = BatchElementError.ErrorCode.kEntityResolutionError
-        elif isinstance(exc, bal.InvalidEntityVersion):
-            code = BatchElementError.ErrorCode.kEntityResolutionError
-        elif isinstance(exc, bal.InaccessibleEntity):
-            code = BatchElementError.ErrorCode.kEntityAccessError
-        elif isinstance(exc, bal.UnknownTraitSet):
-            code = BatchElementError.ErrorCode.kInvalidTraitSet
-        else:
+        exc_type = type(exc)
+        code = _EXCEPTION_ERROR_CODES.get(exc_type)
+        if code is None:
+            # Not an exact match, so walk the MRO such that subclasses
+            # map to the same code.
+            code = next(
+                (
+                    _EXCEPTION_ERROR_CODES[base]
+                    for base in exc_type.__mro__[1:]
+                    if base in _EXCEPTION_ERROR_CODES
+                ),
+                None,
+            )
+        if code is None:
             raise exc
 
-        error_callback(idx, BatchElementError(code, msg))
-
-    @staticmethod
-    def __make_default_settings() -> dict:
-        """
-        Generates a default settings dict for BAL.
-
-        Note: as a library is required, the default settings are not enough
-        to initialize the manager.
-        """
-        return {
-            SETTINGS_KEY_LIBRARY_PATH: "",
-            SETTINGS_KEY_SIMULATED_QUERY_LATENCY: 10,
-            SETTINGS_KEY_ENTITY_REFERENCE_URL_SCHEME: "bal",
-        }
+        error_callback(idx, BatchElementError(code, str(exc)))
 
     @staticmethod
     def __validate_settings(settings: dict):
@@ -856,38 +992,8 @@ class BasicAssetLibraryInterface(ManagerInterface):
                 raise ValueError(f"{SETTINGS_KEY_ENTITY_REFERENCE_URL_SCHEME} must be a string")
             if not scheme:
                 raise ValueError(f"{SETTINGS_KEY_ENTITY_REFERENCE_URL_SCHEME} must not be empty")
-            if not re.match(r"^[a-zA-Z0-9-]+$", scheme):
+            if not _URL_SCHEME_PATTERN.match(scheme):
                 raise ValueError(
                     f"{SETTINGS_KEY_ENTITY_REFERENCE_URL_SCHEME} '{scheme}' must only consist of "
                     "legal URL scheme characters (a-z, A-Z, 0-9, -)"
                 )
-
-
-class BALEntityReferencePagerInterface(EntityReferencePagerInterface):
-    """
-    Simple implementation of a pager.
-
-    Bulk-queries all data, then splits up into cached pages ready to
-    regurgitate on demand.
-    """
-
-    def __init__(self, simulated_latency, page_size, entity_references):
-        EntityReferencePagerInterface.__init__(self)
-        self.simulated_latency = simulated_latency
-        self.__page_num = 0
-        self.__pages = []
-
-        for page_start in range(0, len(entity_references), page_size):
-            self.__pages.append(entity_references[page_start : page_start + page_size])
-
-    @simulated_delay
-    def hasNext(self, _hostSession):
-        return self.__page_num < len(self.__pages) - 1
-
-    @simulated_delay
-    def next(self, _hostSession):
-        self.__page_num += 1
-
-    @simulated_delay
-    def get(self, _hostSession):
-        return self.__pages[self.__page_num] if self.__page_num < len(self.__pages) else []
@@ -24,7 +24,7 @@ an asset management system". Consequently, it omits a plethora of "good
 engineering practice".
 """
 
-import copy
+import collections
 import json
 import os
 import posixpath
@@ -32,11 +32,12 @@ import string
 import pathlib
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, List, Set, Optional
 from urllib.parse import urlparse, urlunparse
 
 
-@dataclass
+@dataclass(slots=True)
 class EntityInfo:
     """
     Identifies an entity within the BAL library. Convertible to/from
@@ -49,7 +50,7 @@ class EntityInfo:
     access: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Entity:
     """
     The data for a specific entity in the library, including traits,
@@ -61,7 +62,7 @@ class Entity:
     relations: List[dict]
 
 
-@dataclass
+@dataclass(slots=True)
 class Relation:
     """
     The definition of a relationship to other entities. The nature of
@@ -84,7 +85,7 @@ def load_library(path: str) -> dict:
             library.update(json.load(file))
         lib_path = os.path.abspath(path)
         lib_dir = os.path.dirname(lib_path)
-        lib_dir_url = pathlib.Path(lib_dir).as_uri()
+        lib_dir_url = _dir_url(lib_dir)
     else:
         lib_path = ""
         lib_dir = ""
@@ -98,6 +99,18 @@ def load_library(path: str) -> dict:
     return library
 
 
+@lru_cache(maxsize=64)
+def _dir_url(abs_dir: str) -> str:
+    """
+    Returns the file URL for the supplied absolute directory path.
+
+    The library is often reloaded from the same path, so results are
+    cached. Keyed on the absolute path, as a relative one depends on
+    the current working directory.
+    """
+    return pathlib.Path(abs_dir).as_uri()
+
+
 def parse_library(library_json: str):
     """
     Parse the library from a JSON string.
@@ -109,10 +122,29 @@ def exists(entity_info: EntityInfo, library: dict) -> bool:
     """
     Determines if the supplied entity exists in the library
     """
-    if entity_info.name not in library["entities"]:
+    return _exists(entity_info, _library_entity_dict(entity_info, library))
+
+
+def entities_exist(entity_infos: List[EntityInfo], library: dict) -> List[bool]:
+    """
+    Determines if each of the supplied entities exists in the library,
+    returning a list of bools in the same order.
+    """
+    entities_dict = library["entities"]
+    return [
+        _exists(entity_info, entities_dict.get(entity_info.name)) for entity_info in entity_infos
+    ]
+
+
+def _exists(entity_info: EntityInfo, entity_dict: Optional[dict]) -> bool:
+    """
+    Determines if the supplied entity exists, given its (possibly
+    missing) top-level library entry.
+    """
+    if entity_dict is None:
         return False
 
-    version_dict, _ = _entity_version_dict_and_tag(entity_info, library)
+    version_dict, _ = _entity_version_dict_and_tag(entity_info, entity_dict)
     if version_dict is None:
         return False
 
@@ -132,26 +164,85 @@ def default_entity(trait_set: Set[str], access: str, library: dict) -> str:
     raise UnknownTraitSet(trait_set)
 
 
-def entity(entity_info: EntityInfo, library: dict) -> Entity:
+def entity(entity_info: EntityInfo, library: dict, with_relations: bool = True) -> Entity:
     """
     Retrieves the Entity data addressed by the supplied EntityInfo
+
+    If with_relations is False, the Entity's relations are left empty,
+    saving building them for callers that only need its traits.
+    """
+    return _entity(
+        entity_info, _library_entity_dict(entity_info, library), library, with_relations
+    )
+
+
+def entities(entity_infos: List[EntityInfo], library: dict, with_relations: bool = True) -> List:
+    """
+    Retrieves the Entity data addressed by each of the supplied
+    EntityInfos, in the same order.
+
+    Rather than raising, the exception that `entity` would raise for an
+    element is returned at its index. Duplicate EntityInfos are only
+    looked up once, and so share the same Entity (or exception).
+    with_relations is as per `entity`.
+    """
+    entities_dict = library["entities"]
+    results_by_key = {}
+    results = []
+    for entity_info in entity_infos:
+        key = (entity_info.name, entity_info.version, entity_info.access)
+        result = results_by_key.get(key)
+        if result is None:
+            try:
+                result = _entity(
+                    entity_info, entities_dict.get(entity_info.name), library, with_relations
+                )
+            except (UnknownBALEntity, InvalidEntityVersion, InaccessibleEntity) as exc:
+                result = exc
+            results_by_key[key] = result
+        results.append(result)
+    return results
+
+
+def _entity(
+    entity_info: EntityInfo, entity_dict: Optional[dict], library: dict, with_relations: bool
+) -> Entity:
+    """
+    Builds the Entity addressed by the supplied EntityInfo from its
+    (possibly missing) top-level library entry.
+    """
+    version_dict, version_idx = _readable_entity_version_dict_and_tag(entity_info, entity_dict)
+
+    relations = []
+    if with_relations:
+        relations = [
+            Relation(
+                traits=relation["traits"],
+                entity_infos=[
+                    EntityInfo(name, version=None, access=entity_info.access)
+                    for name in relation["entities"]
+                ],
+            )
+            for relation in entity_dict.get("relations", [])
+        ]
+
+    # Expand vars late to allow more flexibility
+    expanded_version_dict = _copy_and_expand_trait_properties(version_dict, library)
+    return Entity(**expanded_version_dict, relations=relations, version=version_idx)
+
+
+def _readable_entity_version_dict_and_tag(
+    entity_info: EntityInfo, entity_dict: Optional[dict]
+) -> (dict, int):
+    """
+    Returns the unexpanded version dict and corresponding tag addressed
+    by the supplied EntityInfo, given its (possibly missing) top-level
+    library entry, raising if that version can't be read.
     """
-    entity_dict = _library_entity_dict(entity_info, library)
     if entity_dict is None:
         raise UnknownBALEntity(entity_info)
 
-    relations = [
-        Relation(
-            traits=relation["traits"],
-            entity_infos=[
-                EntityInfo(name, version=None, access=entity_info.access)
-                for name in relation["entities"]
-            ],
-        )
-        for relation in entity_dict.get("relations", [])
-    ]
-
-    version_dict, version_idx = _entity_version_dict_and_tag(entity_info, library)
+    version_dict, version_idx = _entity_version_dict_and_tag(entity_info, entity_dict)
     if version_dict is None:
         # No version found or explicitly null entry, simulating a failed
         # resolution.
@@ -160,9 +251,7 @@ def entity(entity_info: EntityInfo, library: dict) -> Entity:
         # Version found but dict empty, simulating an access error.
         raise InaccessibleEntity(entity_info)
 
-    # Expand vars late to allow more flexibility
-    expanded_version_dict = _copy_and_expand_trait_properties(version_dict, library)
-    return Entity(**expanded_version_dict, relations=relations, version=version_idx)
+    return version_dict, version_idx
 
 
 def management_policy(trait_set: Set[str], access: str, library: dict) -> dict:
@@ -190,23 +279,42 @@ def versions(entity_info: EntityInfo, include_latest: bool, library: dict) -> Li
     Retrieves a list of version of the entity, if include_latest is
     true, then an EntityInfo that always retrieves the latest entity
     will be prepended to the list. Entities are returned newest first.
-    """
-    results = []
 
+    Use `entity_version` to look up a single specific version.
+    """
     entity_dict = _library_entity_dict(entity_info, library)
     if entity_dict is None:
         raise UnknownBALEntity(entity_info)
 
+    name = entity_info.name
+    access = entity_info.access
+
+    results = []
     if include_latest:
-        results.append(EntityInfo(name=entity_info.name, version=None, access=entity_info.access))
+        results.append(EntityInfo(name=name, version=None, access=access))
 
     num_versions = len(entity_dict["versions"])
-    for i in range(num_versions, 0, -1):
-        results.append(EntityInfo(name=entity_info.name, version=i, access=entity_info.access))
+    results += [
+        EntityInfo(name=name, version=i, access=access) for i in range(num_versions, 0, -1)
+    ]
 
     return results
 
 
+def entity_version(entity_info: EntityInfo, version: int, library: dict) -> Optional[EntityInfo]:
+    """
+    Retrieves the EntityInfo for the specified version of the entity,
+    or None if the entity has no such version.
+    """
+    entity_dict = _library_entity_dict(entity_info, library)
+    if entity_dict is None:
+        raise UnknownBALEntity(entity_info)
+
+    if not 1 <= version <= len(entity_dict["versions"]):
+        return None
+    return EntityInfo(name=entity_info.name, version=version, access=entity_info.access)
+
+
 def related_references(
     entity_info: EntityInfo,
     requested_relation_traits: dict,
@@ -222,15 +330,29 @@ def related_references(
     # Will throw if invalid
     entity_data = entity(entity_info, library)
 
+    # Related entities are only checked for existence and trait ids, so
+    # their properties needn't be copied and expanded. Relation
+    # EntityInfos are all unversioned with the same access, so each
+    # related entity need only be checked once.
+    entities_dict = library["entities"]
+    related_traits_by_name = {}
+
     for relation in entity_data.relations:
         # Check if this relation contains the requested traits
         if not _dict_has_traits(relation.traits, requested_relation_traits):
             continue
         for related_entity_info in relation.entity_infos:
-            # Check the entity exists, this will throw if not
-            relation_data = entity(related_entity_info, library)
+            name = related_entity_info.name
+            related_traits = related_traits_by_name.get(name)
+            if related_traits is None:
+                # Check the entity exists, this will throw if not
+                version_dict, _ = _readable_entity_version_dict_and_tag(
+                    related_entity_info, entities_dict.get(name)
+                )
+                related_traits = version_dict["traits"]
+                related_traits_by_name[name] = related_traits
             # Check the target entities have the requested traits if needed
-            if result_trait_set and not _entity_has_trait_set(relation_data, result_trait_set):
+            if result_trait_set and not _entity_has_trait_set(related_traits, result_trait_set):
                 continue
             results.append(related_entity_info)
 
@@ -255,13 +377,13 @@ def create_or_update_entity(
 
 
 def _entity_version_dict_and_tag(
-    entity_info: EntityInfo, library: dict
+    entity_info: EntityInfo, entity_dict: dict
 ) -> (Optional[dict], Optional[int]):
     """
     Returns the entity version dict and corresponding tag for the
-    specified entity, or None if that version does not exist.
+    specified entity, given its top-level library entry, or None if
+    that version does not exist.
     """
-    entity_dict = _ensure_library_entity_dict(entity_info, library)
     versions_list = entity_dict["versions"]
 
     access_overrides = entity_dict.get("overrideByAccess", {})
@@ -317,21 +439,22 @@ def _dict_has_traits(data: dict, traits: dict) -> bool:
     value. Additional keys at either level in the data dict are ignored.
     """
     for trait_id, trait_data in traits.items():
-        if trait_id not in data:
+        data_trait_data = data.get(trait_id)
+        if data_trait_data is None:
             return False
         for property_key, value in trait_data.items():
-            if data[trait_id].get(property_key) != value:
+            if data_trait_data.get(property_key) != value:
                 return False
     return True
 
 
-def _entity_has_trait_set(entity_data: Entity, trait_set: Set[str]) -> bool:
+def _entity_has_trait_set(entity_traits: dict, trait_set: Set[str]) -> bool:
     """
-    Determines if the supplied entity has the requested trait ids within
-    its trait set.
+    Determines if the supplied entity traits dict has the requested
+    trait ids within its trait set.
     """
     for trait in trait_set:
-        if trait not in entity_data.traits:
+        if trait not in entity_traits:
             return False
     return True
 
@@ -344,11 +467,24 @@ def _copy_and_expand_trait_properties(entity_version_dict: dict, library: dict)
 
     Supports $var and ${var}.
     """
-    expanded_dict = copy.deepcopy(entity_version_dict)
+    # Trait properties are scalars (see schema.json), so copying the
+    # two levels of dicts is as good as, and much cheaper than, a
+    # deepcopy.
+    expanded_dict = dict(entity_version_dict)
+    expanded_dict["traits"] = {
+        trait_id: dict(trait_data)
+        for trait_id, trait_data in entity_version_dict["traits"].items()
+    }
+
+    substitutions = None
 
     for _, trait_data in expanded_dict["traits"].items():
         for prop, value in trait_data.items():
-            if isinstance(value, str):
+            if not isinstance(value, str):
+                continue
+            # Most values have no variables, so skip the substitution
+            # entirely for those.
+            if "$" in value:
                 # On Windows, some iteration methods applied to
                 # os.environ miss out keys:
                 #
@@ -362,25 +498,29 @@ def _copy_and_expand_trait_properties(entity_version_dict: dict, library: dict)
                 #   False
                 #
                 # As such, we need to use the original object, and
-                # append the other vars as kwarg. Fortunately this has
-                # exactly the precedence behaviour we want.
-                trait_data[prop] = string.Template(value).safe_substitute(
-                    os.environ, **library.get("variables", {})
-                )
+                # layer the other vars over it. A ChainMap is exactly
+                # what safe_substitute would build from kwargs, but it
+                # can be built just once and shared by all properties.
+                if substitutions is None:
+                    substitutions = collections.ChainMap(library.get("variables", {}), os.environ)
+                value = string.Template(value).safe_substitute(substitutions)
+                trait_data[prop] = value
 
-                subbed_val = trait_data[prop]
-
-                if subbed_val.startswith("file:"):
-                    trait_data[prop] = normalize_file_url(subbed_val)
+            if value.startswith("file:"):
+                trait_data[prop] = normalize_file_url(value)
 
     return expanded_dict
 
 
+@lru_cache(maxsize=4096)
 def normalize_file_url(maybe_file_url):
     """
     Any string in the library that begins with "file:" will be
     normalized, the main point of this being to collapse upward
     traversals that have been written into the library json.
+
+    The same URLs are normalized each time an entity is retrieved,
+    so results are cached.
     """
     # Modified from https://stackoverflow.com/a/4317446
 
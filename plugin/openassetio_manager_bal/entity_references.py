@@ -0,0 +1,184 @@
+#
+#   Copyright 2013-2023 [The Foundry Visionmongers Ltd]
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Parsing and creation of BAL entity references, which have the form
+`<scheme>:///<name>[?v=<version>]`, and paging through them.
+"""
+
+import time
+
+from functools import lru_cache
+from typing import Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from openassetio import EntityReference
+from openassetio.managerApi import EntityReferencePagerInterface
+
+VERSION_TAG_LATEST = "latest"
+
+# Characters that urlparse strips from anywhere in a URL, which the
+# direct split in parse_entity_ref doesn't handle.
+_URLPARSE_STRIPPED_CHARS = frozenset("\t\r\n")
+
+
+@lru_cache(maxsize=4096)
+def parse_entity_ref(
+    entity_ref: str, prefix: str
+) -> Tuple[Optional[str], Optional[int], Optional[str]]:
+    """
+    Decomposes an entity reference into its entity name and version.
+
+    BAL references have a fixed `<prefix><name>[?v=<version>]` form,
+    so rather than using the generic urllib machinery, the reference is
+    split directly around the known prefix. Anything else (e.g. a
+    reference using a different scheme, or containing characters
+    `urlparse` would strip) falls back to `urlparse`.
+
+    Returns a `(name, version, malformed_reason)` tuple, where
+    `malformed_reason` is None for a valid reference. Malformed
+    references are reported rather than raised so batches containing
+    them avoid exception handling.
+
+    This is a pure function of its arguments, so results (malformed or
+    not) are cached to avoid re-parsing references that recur within or
+    across batches.
+    """
+    if entity_ref.startswith(prefix) and _URLPARSE_STRIPPED_CHARS.isdisjoint(entity_ref):
+        # Discard any fragment, then split off the query string.
+        path, _, _ = entity_ref[len(prefix) :].partition("#")
+        name, _, query = path.partition("?")
+    else:
+        uri_parts = urlparse(entity_ref)
+        # path will start with a /
+        name, query = uri_parts.path[1:], uri_parts.query
+
+    if not name:
+        return None, None, "Missing entity name in path component"
+
+    if not query:
+        return name, None, None
+
+    version, malformed_reason = _version_from_query(query)
+    if malformed_reason is not None:
+        return None, None, malformed_reason
+    return name, version, None
+
+
+def _version_from_query(query: str) -> Tuple[Optional[int], Optional[str]]:
+    """
+    Determine the version based on the presence of 'v' in the
+    supplied query string. As with `parse_qs`, the last non-empty 'v'
+    wins.
+
+    Returns a `(version, malformed_reason)` tuple, see
+    `parse_entity_ref`.
+    """
+    if "%" in query or "+" in query:
+        # Escaped params are unusual, so defer to the stdlib to decode.
+        v_str = parse_qs(query).get("v", [None])[-1]
+    else:
+        v_str = None
+        for param in query.split("&"):
+            if param.startswith("v=") and len(param) > 2:
+                v_str = param[2:]
+
+    if v_str is None or v_str == VERSION_TAG_LATEST:
+        return None, None
+
+    try:
+        version = int(v_str)
+    except ValueError:
+        return None, f"Version query parameter 'v' must be an int or '{VERSION_TAG_LATEST}'"
+    if version < 1:
+        return None, "Version query parameter 'v' must be greater than 1"
+
+    return version, None
+
+
+def make_entity_ref_factory(prefix: str):
+    """
+    Returns a function that creates an openassetio EntityReference for
+    a given entity name and version, using the supplied prefix.
+
+    EntityReferences are immutable, so results are cached (and shared),
+    as relationship queries commonly return the same entities
+    repeatedly. The factory is independent of the manager, so pagers
+    can hold on to it without seeing later changes to its settings.
+    """
+
+    @lru_cache(maxsize=1024)
+    def create_entity_ref(name: str, version: Optional[int]) -> EntityReference:
+        ref_string = f"{prefix}{name}"
+        if version:
+            ref_string += f"?v={version}"
+        return EntityReference(ref_string)
+
+    return create_entity_ref
+
+
+class BALEntityReferencePagerInterface(EntityReferencePagerInterface):
+    """
+    Simple implementation of a pager.
+
+    Bulk-queries all data, then builds entity references for each page
+    on demand, so pages the host never visits cost nothing.
+    """
+
+    # A pager is created per element of a relationship query, so avoid
+    # a per-instance __dict__.
+    __slots__ = (
+        "__simulated_delay_s",
+        "__page_num",
+        "__page_size",
+        "__entity_infos",
+        "__create_entity_ref",
+        "__num_pages",
+    )
+
+    def __init__(self, simulated_delay_s, page_size, entity_infos, create_entity_ref):
+        EntityReferencePagerInterface.__init__(self)
+        # Already converted from the manager's millisecond setting.
+        self.__simulated_delay_s = simulated_delay_s
+        self.__page_num = 0
+        self.__page_size = page_size
+        self.__entity_infos = entity_infos
+        self.__create_entity_ref = create_entity_ref
+        self.__num_pages = (len(entity_infos) + page_size - 1) // page_size
+
+    # Methods in C++ end up with "missing docstring", and use its
+    # naming conventions.
+    # pylint: disable=missing-function-docstring, invalid-name
+
+    # The simulated delay is checked inline, rather than via the
+    # simulated_delay decorator, to save a call per page.
+
+    def hasNext(self, _hostSession):
+        if self.__simulated_delay_s:
+            time.sleep(self.__simulated_delay_s)
+        return self.__page_num + 1 < self.__num_pages
+
+    def next(self, _hostSession):
+        if self.__simulated_delay_s:
+            time.sleep(self.__simulated_delay_s)
+        self.__page_num += 1
+
+    def get(self, _hostSession):
+        if self.__simulated_delay_s:
+            time.sleep(self.__simulated_delay_s)
+        page_start = self.__page_num * self.__page_size
+        page = self.__entity_infos[page_start : page_start + self.__page_size]
+        create_entity_ref = self.__create_entity_ref
+        return [create_entity_ref(entity_info.name, entity_info.version) for entity_info in page]
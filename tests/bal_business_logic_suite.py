@@ -28,7 +28,7 @@ import pathlib
 
 from unittest import mock
 
-from openassetio import constants
+from openassetio import constants, EntityReference
 from openassetio.hostApi import Manager
 from openassetio.managerApi import ManagerInterface
 from openassetio.access import (
@@ -180,7 +180,7 @@ class Test_initialize_entity_reference_scheme(FixtureAugmentedTestCase):
                 self.initialize_and_assert_scheme(scheme)
 
     def test_when_set_with_invalid_sceheme_then_exception_raised(self):
-        for scheme in ("", "c://b", "no_us", "sadly no 🦆", "or spaces", 234, False):
+        for scheme in ("", "c://b", "no_us", "sadly no 🦆", "or spaces", "bal\n", 234, False):
             with self.subTest(scheme=scheme):
                 with self.assertRaises(ValueError):
                     self.initialize_and_assert_scheme(scheme)
@@ -229,6 +229,56 @@ class Test_initialize_entity_reference_scheme(FixtureAugmentedTestCase):
         )
         self.assertTrue(str(published_refs[0]).startswith(prefix))
 
+    def test_when_reference_uses_different_scheme_then_still_parsed(self):
+        self._manager.initialize(
+            {
+                "library_path": os.path.join(resources_path(), "library_apiComplianceSuite.json"),
+                "entity_reference_url_scheme": "other",
+            }
+        )
+        # createEntityReference would reject the mismatched scheme.
+        data = self._manager.resolve(
+            EntityReference("bal:///anAsset⭐︎?v=1"),
+            {VersionTrait.kId},
+            ResolveAccess.kRead,
+            self.createTestContext(),
+        )
+        self.assertEqual(VersionTrait(data).getStableTag(), "1")
+
+    def test_when_reinitialized_after_relationship_query_then_pager_uses_original_scheme(self):
+        self._manager.initialize(
+            {"library_path": os.path.join(resources_path(), "library_apiComplianceSuite.json")}
+        )
+        context = self.createTestContext()
+        entity_reference = self._manager.createEntityReference("bal:///entity/original")
+        relationship = TraitsData({"proxy"})
+
+        pagers = []
+        self._manager.getWithRelationship(
+            [entity_reference],
+            relationship,
+            10,
+            RelationsAccess.kRead,
+            context,
+            lambda _idx, pager: pagers.append(pager),
+            lambda _idx, err: self.fail(f"Failed to query relationship: {err.message}"),
+        )
+        self._manager.getWithRelationships(
+            entity_reference,
+            [relationship],
+            10,
+            RelationsAccess.kRead,
+            context,
+            lambda _idx, pager: pagers.append(pager),
+            lambda _idx, err: self.fail(f"Failed to query relationships: {err.message}"),
+        )
+
+        self._manager.initialize({"entity_reference_url_scheme": "other"})
+
+        expected = ["bal:///entity/proxy/1", "bal:///entity/proxy/2", "bal:///entity/proxy/3"]
+        for pager in pagers:
+            self.assertListEqual([ref.toString() for ref in pager.get()], expected)
+
 
 class Test_initialize_library_as_json_string(LibraryOverrideTestCase):
     # Override library just to ensure the cleanup step gets added,
@@ -254,6 +304,59 @@ class Test_initialize_library_as_json_string(LibraryOverrideTestCase):
 
         self.assertDictEqual(actual_library, expected_library)
 
+    def test_when_library_json_changes_policy_then_new_policy_used(self):
+        context = self.createTestContext()
+        trait_set = {"someTrait"}
+        entity_reference = self._manager.createEntityReference("bal:///a_new_entity")
+
+        # Query the original policies first, so any cached policies
+        # would be seen below.
+        self.assertListEqual(
+            self._manager.managementPolicy([trait_set], PolicyAccess.kWrite, context),
+            [TraitsData({"bal:test.SomePolicy"})],
+        )
+        self._manager.preflight(
+            [entity_reference],
+            [TraitsData(trait_set)],
+            PublishingAccess.kWrite,
+            context,
+            lambda _idx, _ref: None,
+            lambda _idx, err: self.fail(f"Preflight failed: {err.message}"),
+        )
+
+        new_library = {
+            "managementPolicy": {
+                "read": {"default": {"some.policy": {}}},
+                "write": {"default": {}},
+            }
+        }
+        self._manager.initialize({"library_json": json.dumps(new_library)})
+
+        self.assertListEqual(
+            self._manager.managementPolicy([trait_set], PolicyAccess.kRead, context),
+            [TraitsData({"some.policy"})],
+        )
+        self.assertListEqual(
+            self._manager.managementPolicy([trait_set], PolicyAccess.kWrite, context),
+            [TraitsData()],
+        )
+
+        expected_error = BatchElementError(
+            BatchElementError.ErrorCode.kInvalidTraitSet,
+            "Publishing is not supported for the given trait set",
+        )
+        actual = []
+        for method in (self._manager.preflight, self._manager.register):
+            method(
+                [entity_reference],
+                [TraitsData(trait_set)],
+                PublishingAccess.kWrite,
+                context,
+                lambda _idx, _ref: self.fail("Publishing should be rejected by the policy"),
+                lambda _idx, err: actual.append(err),
+            )
+        self.assertListEqual(actual, [expected_error, expected_error])
+
     def test_when_library_json_is_invalid_primitive_value_then_raises(self):
         with self.assertRaises(ValueError) as err:
             self._manager.initialize({"library_json": ""})
@@ -1243,6 +1346,47 @@ class Test_resolve_version_query_param(FixtureAugmentedTestCase):
         self.assertEqual(version_trait.getStableTag(), expected_stable)
 
 
+class Test_entity_reference_parsing(FixtureAugmentedTestCase):
+    def test_when_v_is_repeated_then_last_is_used(self):
+        self.assertStableTag(self.__ref("anAsset⭐︎?v=1&v=2"), "2")
+        self.assertStableTag(self.__ref("anAsset⭐︎?v=2&v=1"), "1")
+
+    def test_when_v_is_blank_then_it_is_ignored(self):
+        self.assertStableTag(self.__ref("anAsset⭐︎?v="), "2")
+        self.assertStableTag(self.__ref("anAsset⭐︎?v=1&v="), "1")
+
+    def test_when_fragment_present_then_it_is_ignored(self):
+        self.assertStableTag(self.__ref("anAsset⭐︎?v=1#v=2"), "1")
+        self.assertStableTag(self.__ref("anAsset⭐︎#?v=1"), "2")
+
+    def test_when_query_is_escaped_then_it_is_decoded(self):
+        self.assertStableTag(self.__ref("anAsset⭐︎?v=%31"), "1")
+        self.assertStableTag(self.__ref("anAsset⭐︎?%76=1"), "1")
+        self.assertStableTag(self.__ref("anAsset⭐︎?v=+1"), "1")
+
+    def test_when_tabs_or_newlines_present_then_they_are_ignored(self):
+        self.assertStableTag(self.__ref("anAsset⭐︎?v=\t1\n"), "1")
+
+    def test_when_path_params_present_then_they_are_part_of_the_name(self):
+        with self.assertRaises(BatchElementException):
+            self.assertStableTag(self.__ref("anAsset⭐︎;param?v=1"), "1")
+
+    def __ref(self, ref_suffix):
+        return self._manager.createEntityReference(f"bal:///{ref_suffix}")
+
+    def assertStableTag(self, entity_reference, expected_stable):
+        """
+        Asserts the reference resolves to the expected entity version.
+        """
+        data = self._manager.resolve(
+            entity_reference,
+            {VersionTrait.kId},
+            ResolveAccess.kRead,
+            self.createTestContext(),
+        )
+        self.assertEqual(VersionTrait(data).getStableTag(), expected_stable)
+
+
 class Test_getWithRelationship_All(FixtureAugmentedTestCase):
     # pylint: disable=cell-var-from-loop,unbalanced-tuple-unpacking
     def test_when_unsupported_access_then_kEntityAccessError_returned(self):
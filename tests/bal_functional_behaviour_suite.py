@@ -137,6 +137,27 @@ class Test_simulated_latency(FixtureAugmentedTestCase):
             self.createTestContext(),
         )
 
+    def test_when_resolve_batch_is_empty_then_results_not_delayed(self):
+        self.__check_no_simulated_latency(
+            self._manager.resolve,
+            [],
+            {"string"},
+            ResolveAccess.kRead,
+            self.createTestContext(),
+        )
+
+    def test_when_getWithRelationships_batch_is_empty_then_results_not_delayed(self):
+        entity_ref = self.create_test_entity_references()[0]
+
+        self.__check_no_simulated_latency(
+            self._manager.getWithRelationships,
+            entity_ref,
+            [],
+            1,
+            RelationsAccess.kRead,
+            self.createTestContext(),
+        )
+
     def test_when_pager_hasNext_called_then_results_delayed(
         self,
     ):
@@ -233,6 +254,12 @@ class Test_simulated_latency(FixtureAugmentedTestCase):
             with self.__assert_simulated_latency_applied(query_latency):
                 method(*args, mock.Mock(), mock.Mock(), **kwargs)
 
+    def __check_no_simulated_latency(self, method, *args, **kwargs):
+        for _ in self.__simulated_latency_subtests():
+            with mock.patch("time.sleep") as patched_time_sleep:
+                method(*args, mock.Mock(), mock.Mock(), **kwargs)
+                patched_time_sleep.assert_not_called()
+
     def __simulated_latency_subtests(self):
         for query_latency in self.__test_query_latencies:
             with self.subTest(query_latency=query_latency):